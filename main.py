@@ -18,12 +18,16 @@ __contact__ = {
 import os
 import sys
 import asyncio
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 import discord
 import config
 from src.twitchbot import CodemanTwitchBot
 from src.discordbot import CodemanDiscordBot
 from src.spotify import SpotifyClient
-from src.thread_manager import DiscordThread
 
 BUNDLE_DIRECTORY = getattr(sys, "_MEIPASS", os.path.abspath(os.path.dirname(__file__)))
 ASSETS_FILE_PATH = os.path.abspath(os.path.join(BUNDLE_DIRECTORY, "assets"))
@@ -76,18 +80,19 @@ async def main():
         logging_path=config.LOGS_FILE_PATH,
     )
 
-    discord_thread = DiscordThread(
-        target=codeman_discord_bot.run, key=config.DISCORD_SECRET, name="Discord_Thread"
-    )
-    discord_thread.start()
-
+    # Run both bots cooperatively on the one event loop; discord.py's
+    # Client.start() is a coroutine, so no dedicated thread is needed
     await asyncio.gather(
         codeman_twitch_bot.run(),
+        codeman_discord_bot.start(config.DISCORD_SECRET),
     )
 
-    discord_thread.join()
-
 
 if __name__ == "__main__":
 
+    if uvloop is not None:
+        # libuv-based loop; noticeably faster socket dispatch for the
+        # IRC/Discord/HTTP traffic. Not available on Windows.
+        uvloop.install()
+
     asyncio.run(main())
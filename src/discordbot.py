@@ -14,6 +14,7 @@ __contact__ = {
     "Email": "dev@codydeeran.com",
 }
 
+import io
 from typing import Any
 from discord import Client
 from discord import Intents
@@ -22,6 +23,22 @@ from discord import Embed
 from discord import File
 import emoji
 
+# Discord id of the channel owner; only they may use !live
+OWNER_ID = 739002023755644999
+
+GREETINGS = frozenset(
+    {
+        "hello",
+        "hi",
+        "sup",
+        "what's up",
+        "whats up",
+        "what up",
+        "wat up",
+        "yo",
+    }
+)
+
 
 class CodemanDiscordBot(Client):
     """
@@ -44,6 +61,24 @@ class CodemanDiscordBot(Client):
         self.twitch_url: str = twitch_url
         self.twitch_channel: str = twitch_channel
         self.notifications_channel_id: int = notifications_channel_id
+        # command word -> handler; one hashed lookup per message instead of
+        # chained startswith checks
+        self._commands: dict = {
+            "!help": self._cmd_help,
+            "!live": self._cmd_live,
+        }
+        # emojize once at construction; per-notification we only .format()
+        # the author mention into the template
+        self._notification_template: str = emoji.emojize(
+            "@everyone\n\n**{mention} is LIVE on TWITCH! "
+            ":video_camera: :red_circle: :video_game:**\n\n"
+            "**WATCH :eyes:**\n\n"
+        )
+        self._notifications_channel = None
+        # the logo never changes; keep the bytes in memory and serve each
+        # notification from a BytesIO instead of re-reading the file
+        with open("./assets/brand-logo.png", "rb") as logo:
+            self._brand_logo_bytes: bytes = logo.read()
 
     async def on_ready(self):
         """
@@ -51,6 +86,10 @@ class CodemanDiscordBot(Client):
         """
         print(f"{self.user} is now up and running on Discord!")
 
+        # resolve the notifications channel once the cache is populated so
+        # !live doesn't do the lookup per notification
+        self._notifications_channel = self.get_channel(self.notifications_channel_id)
+
     async def on_message(self, message: Message):
         """
         Discord message to process
@@ -59,41 +98,53 @@ class CodemanDiscordBot(Client):
             message (Message): discord.Message Object
         """
 
+        # cheapest checks first: ignore ourselves and other bots before doing
+        # any string work on the content
+        if message.author == self.user or message.author.bot:
+            return
+
         message_content = message.content.lower()
 
-        if message.author == self.user:
+        # note: this used to test the case-preserved content against
+        # lowercase strings; use the lowered copy so "Hello" greets too
+        if message_content in GREETINGS:
+            await message.channel.send(f"Hello! {message.author.mention}")
             return
 
-        if message.content in [
-            "hello",
-            "hi",
-            "sup",
-            "what's up",
-            "whats up",
-            "what up",
-            "wat up",
-            "yo",
-        ]:
-            await message.channel.send(f"Hello! {message.author.mention}")
-        elif message_content == "!help":
-            await message.author.send("test")
-
-        elif (
-            message.content.startswith("!live")
-            and message.author.id == 739002023755644999
-        ):
-            message.content = message.content.strip("!live").strip()
-            await self.post_twitch_message(message)
-        elif (
-            message.content.startswith("!live")
-            and message.author.id != 739002023755644999
-        ):
+        command, _, body = message.content.partition(" ")
+        handler = self._commands.get(command.lower())
+        if handler:
+            await handler(message, body.strip())
+
+    async def _cmd_help(self, message: Message, body: str) -> None:
+        """
+        DM the user the help text
+
+        Args:
+            message (Message): discord.Message Object
+            body (str): text after the command word (unused)
+        """
+        await message.author.send("test")
+
+    async def _cmd_live(self, message: Message, body: str) -> None:
+        """
+        Post the going-live notification; restricted to the channel owner.
+        The old startswith/strip("!live") pair chewed matching characters off
+        the message body — the dispatch split hands us the body directly.
+
+        Args:
+            message (Message): discord.Message Object
+            body (str): text after the command word
+        """
+        if message.author.id != OWNER_ID:
             await message.channel.send(
                 f"{message.author.mention} you don't have permission for the '!live' command."
             )
-        else:
             return
 
+        message.content = body
+        await self.post_twitch_message(message)
+
     async def post_twitch_message(self, message: Message) -> None:
         """
         Post the 'going live' message to the notificaitons channel
@@ -104,16 +155,18 @@ class CodemanDiscordBot(Client):
 
         # Channel ID can be found by right clicking on the channel and
         # clicking on the option to 'Copy ID'
-        notifications_channel = self.get_channel(self.notifications_channel_id)
+        notifications_channel = self._notifications_channel or self.get_channel(
+            self.notifications_channel_id
+        )
 
         if notifications_channel:
-            notification = emoji.emojize(
-                f"@everyone\n\n**{message.author.mention} is LIVE on TWITCH! "
-                + ":video_camera: :red_circle: :video_game:**\n\n"
-                + "**WATCH :eyes:**\n\n"
+            notification = self._notification_template.format(
+                mention=message.author.mention
             )
 
-            image_file = File("./assets/brand-logo.png", filename="brand-logo.png")
+            image_file = File(
+                io.BytesIO(self._brand_logo_bytes), filename="brand-logo.png"
+            )
             link_embed = Embed(
                 title=self.twitch_channel,
                 url=self.twitch_url,
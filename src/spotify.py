@@ -15,14 +15,18 @@ __contact__ = {
 
 import asyncio
 import json
-import shutil
+import logging
+import time
+from itertools import islice
 from typing import Any
 from enum import Enum
 from datetime import datetime
-import requests
+import aiohttp
 from spotipy import Spotify
 from spotipy.oauth2 import SpotifyOAuth
 
+logger = logging.getLogger(__name__)
+
 
 class SpotifyReturnCode(Enum):
     """
@@ -67,12 +71,27 @@ class SpotifyClient:
         self.spotify: Spotify = Spotify(client_credentials_manager=self._credentials)
         self._device_name: str = device_name
         self._device_id: int = -1
-        self._local_queue: list = []
+        self._queued_urls: set = set()
+        self._queue_cache: dict = None
+        self._queue_cache_time: float = 0.0
         self.logging_path: str = logging_path
         self.session_log: str = (
             f"spotify_session_{datetime.now().strftime('%d-%m-%y-%H-%M-%S')}.log"
         )
+        if not logger.handlers:
+            # one handler for the life of the client; each log line used to
+            # pay its own open()/lseek()/close() via open(..., "a+")
+            handler = logging.FileHandler(
+                f"{logging_path}/{self.session_log}", encoding="utf-8"
+            )
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
         self._previous_track_id: str = ""
+        self._previous_artwork_url: str = ""
+        self._previous_title: str = ""
+        self._previous_artists: str = ""
+        self._http_session: aiohttp.ClientSession = None
         self.album_artwork = f"{player_overlay_path}/album_artwork.png"
         self.artist = f"{player_overlay_path}/song_artist.txt"
         self.song_title = f"{player_overlay_path}/song_title.txt"
@@ -88,7 +107,7 @@ class SpotifyClient:
         device_id = -1
         devices = self.get_devices()
         for device in devices["devices"]:
-            if device["name"] == self.get_device_name():
+            if device["name"] == self._device_name:
                 device_id = device["id"]
         return device_id
 
@@ -111,29 +130,28 @@ class SpotifyClient:
         Returns:
             SpotifyReturnCode: An enum with the name and value of the error
         """
-        current_retries = 1
         device_id = self._find_device_id()
 
-        with open(
-            f"{self.logging_path}/{self.session_log}", "a+", encoding="utf-8"
-        ) as log:
-            while device_id == -1 and current_retries <= max_attempts:
-                log.write("Attempting to establish spotify device connection...")
-                log.write(f"Retries remaining: {(max_attempts - current_retries)}")
-                device_id = self._find_device_id()
-
+        for current_retries in range(1, max_attempts + 1):
             if device_id != -1:
-                self._set_device_id(device_id)
-                log.write(
-                    f"Established connection to device id: {self.get_device_id()}"
-                )
-                return SpotifyReturnCode.SUCCESS
-            else:
-                log.write(
-                    "Error! Could not establish connection to "
-                    f"device named: {self.get_device_name()}"
-                )
-                return SpotifyReturnCode.FAILED_TO_ESTABLISH_CONNECTION
+                break
+            logger.info("Attempting to establish spotify device connection...")
+            logger.info("Retries remaining: %d", max_attempts - current_retries)
+            # back off between attempts instead of hammering the API in a
+            # tight loop (the old while never advanced its counter)
+            time.sleep(2**current_retries)
+            device_id = self._find_device_id()
+
+        if device_id != -1:
+            self._set_device_id(device_id)
+            logger.info("Established connection to device id: %s", self._device_id)
+            return SpotifyReturnCode.SUCCESS
+
+        logger.error(
+            "Error! Could not establish connection to device named: %s",
+            self._device_name,
+        )
+        return SpotifyReturnCode.FAILED_TO_ESTABLISH_CONNECTION
 
     def get_devices(self) -> json:
         """
@@ -177,12 +195,30 @@ class SpotifyClient:
         if status != SpotifyReturnCode.SUCCESS:
             return status
 
-        for track in self._local_queue:
-            if str(track["url"]) == requested_track:
-                return SpotifyReturnCode.REQUEST_ALREADY_IN_QUEUE
+        if requested_track in self._queued_urls:
+            return SpotifyReturnCode.REQUEST_ALREADY_IN_QUEUE
 
         return SpotifyReturnCode.SUCCESS
 
+    def _get_queue(self, max_age: float = 2.0) -> dict:
+        """
+        Fetch the Spotify queue, reusing a recently fetched payload so the
+        duplicate-check, request and overlay paths don't each pay a full
+        round-trip for the same data.
+
+        Args:
+            max_age (float, optional): seconds a cached payload stays valid.
+                Defaults to 2.0.
+
+        Returns:
+            dict: the queue payload from the Spotify API
+        """
+        now = time.monotonic()
+        if self._queue_cache is None or now - self._queue_cache_time > max_age:
+            self._queue_cache = self.spotify.queue()
+            self._queue_cache_time = time.monotonic()
+        return self._queue_cache
+
     def get_queued_songs(self) -> dict:
         """
         Get the top 3 queued songs for the users
@@ -193,60 +229,41 @@ class SpotifyClient:
                 Key - return_code: Value - Spotify Return Code
         """
         try:
-            current_queue = self.spotify.queue()
-
-            track_counter = 0
-
-            queued_songs = ""
-
-            for song in current_queue["queue"]:
-                track_counter += 1
-                queued_songs += f"{track_counter}. {song['name']} by {', '.join([artist['name'] for artist in song['artists']])}"
+            current_queue = self._get_queue()
 
-                if track_counter < 3:
-                    queued_songs += " | "
-
-                if track_counter == 3:
-                    break
+            queued_songs = " | ".join(
+                f"{position}. {song['name']} by "
+                f"{', '.join(artist['name'] for artist in song['artists'])}"
+                for position, song in enumerate(
+                    islice(current_queue["queue"], 3), start=1
+                )
+            )
 
             return {"response": queued_songs, "return_code": SpotifyReturnCode.SUCCESS}
-        except Exception as error:
-            print(error)
+        except Exception:
+            logger.exception("Failed to read the Spotify queue")
             return {"response": "", "return_code": SpotifyReturnCode.FAILED}
 
     def _update_local_queue(self) -> SpotifyReturnCode:
 
         try:
-            spotify_queue = self.spotify.queue()
-
-            # Get the current song playing so users don't request
-            # a song already being played
-            currently_playing = spotify_queue["currently_playing"]
-            current_track = {
-                "title": currently_playing["name"],
-                "artists": [artist["name"] for artist in currently_playing["artists"]],
-                "url": currently_playing["external_urls"]["spotify"],
-                "uri": currently_playing["uri"],
-            }
-            self._local_queue.append(current_track)
+            spotify_queue = self._get_queue()
 
-            # Get the rest of the queue to ensure duplicates are not in there
+            # Rebuild the URL set from scratch each refresh: the current song
+            # plus everything queued. Membership checks are O(1) and memory
+            # stays bounded by the queue length.
             # NOTE: This will only prevent duplicate requests from interaction with the bot.
             # if the owner of the account has duplicate requests or
             # manually adds a duplicate request there is nothing we can do.
-            for request in spotify_queue["queue"]:
-                queued_track = {
-                    "title": request["name"],
-                    "artists": [artist["name"] for artist in request["artists"]],
-                    "url": request["external_urls"]["spotify"],
-                    "uri": request["uri"],
-                }
-
-                self._local_queue.append(queued_track)
+            currently_playing = spotify_queue["currently_playing"]
+            self._queued_urls = {currently_playing["external_urls"]["spotify"]} | {
+                request["external_urls"]["spotify"]
+                for request in spotify_queue["queue"]
+            }
 
             return SpotifyReturnCode.SUCCESS
-        except Exception as error:
-            print(error.with_traceback())
+        except Exception:
+            logger.exception("Failed to refresh the local queue")
             return SpotifyReturnCode.FAILED
 
     def is_valid_track(self, requested_track: str) -> SpotifyReturnCode:
@@ -290,26 +307,25 @@ class SpotifyClient:
         if status != SpotifyReturnCode.SUCCESS:
             return status
 
-        if self.spotify.currently_playing():
+        # queue() already reports the current track; reuse the cached payload
+        # instead of a second currently-playing round-trip
+        if self._get_queue().get("currently_playing"):
             try:
                 self.spotify.add_to_queue(uri=requested_track)
+                # the cached queue no longer reflects reality; drop it so a
+                # repeat request inside the TTL can't sneak past check_queue
+                self._queue_cache = None
                 return SpotifyReturnCode.SUCCESS
-            except Exception as error:
-                with open(
-                    f"{self.logging_path}/{self.session_log}", "a+", encoding="utf-8"
-                ) as log:
-                    log.write(error.with_traceback())
+            except Exception:
+                logger.exception("Failed to add request to the queue")
                 return SpotifyReturnCode.FAILED_TO_ADD_TO_QUEUE
         else:
             try:
                 self.spotify.start_playback(
-                    uris=[requested_track], device_id=self.get_device_id()
+                    uris=[requested_track], device_id=self._device_id
                 )
-            except Exception as error:
-                with open(
-                    f"{self.logging_path}/{self.session_log}", "a+", encoding="utf-8"
-                ) as log:
-                    log.write(error.with_traceback())
+            except Exception:
+                logger.exception("Failed to begin playback")
                 return SpotifyReturnCode.FAILED_TO_BEGIN_PLAYBACK
 
     def get_now_playing(self):
@@ -337,6 +353,56 @@ class SpotifyClient:
             "return_code": SpotifyReturnCode.NO_CURRENT_PLAYBACK,
         }
 
+    async def _download_artwork(self, artwork_url: str, title: str) -> None:
+        """
+        Download the album artwork for the overlay without blocking the
+        event loop. The ClientSession is created once and reused so each
+        track change doesn't pay a fresh TCP/TLS handshake.
+
+        Args:
+            artwork_url (str): url of the album artwork image
+            title (str): track title, used for the failure message
+        """
+        if self._http_session is None:
+            self._http_session = aiohttp.ClientSession()
+
+        try:
+            async with self._http_session.get(
+                artwork_url, timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                if response.status != 200:
+                    logger.warning("Could not download album artwork for: %s", title)
+                    return
+                data = await response.read()
+        except aiohttp.ClientError:
+            logger.exception("Could not download album artwork for: %s", title)
+            return
+
+        # artwork is <100KB; a single buffered write is one syscall
+        with open(self.album_artwork, "wb") as file:
+            file.write(data)
+
+    def _write_title(self, title: str) -> None:
+        """
+        Write the track title to the overlay file
+
+        Args:
+            title (str): track title
+        """
+        with open(self.song_title, "w", encoding="utf-8") as file:
+            file.write(title + " " * 10)
+
+    def _write_artists(self, artists_text: str) -> None:
+        """
+        Write the track artists to the overlay file
+
+        Args:
+            artists_text (str): joined artist names
+        """
+        with open(self.artist, "w", encoding="utf-8") as file:
+            file.write(artists_text)
+            file.write(" " * 5)
+
     async def update_spotify_stream_player(self, interval: int):
         """
         Update the now playing overlay on the Twitch Stream
@@ -346,9 +412,9 @@ class SpotifyClient:
 
                 # Check that spotify is not paused or down before
                 # attempting to grab the queue
-                if self.spotify.current_playback() is not None:
+                if await asyncio.to_thread(self.spotify.current_playback) is not None:
 
-                    spotify_queue = self.spotify.queue()
+                    spotify_queue = await asyncio.to_thread(self._get_queue)
 
                     # Get the current song playing so users don't request
                     # a song already being played
@@ -365,31 +431,41 @@ class SpotifyClient:
 
                     if current_track["id"] != self._previous_track_id:
 
-                        response = requests.get(
-                            current_track["artwork_url"], stream=True, timeout=5
-                        )
-
-                        if response.status_code == 200:
-                            with open(self.album_artwork, "wb") as file:
-                                shutil.copyfileobj(response.raw, file)
-                        else:
-                            print(
-                                f"Could not download album artwork for: {current_track['title']}"
+                        artists_text = " | ".join(current_track["artists"])
+
+                        # A re-release or single can change the track id while
+                        # the visible overlay stays identical, so only touch
+                        # the files whose contents actually changed. The
+                        # updates are independent; run them concurrently so a
+                        # track change costs the slowest one, not their sum
+                        updates = []
+                        if current_track["artwork_url"] != self._previous_artwork_url:
+                            updates.append(
+                                self._download_artwork(
+                                    current_track["artwork_url"],
+                                    current_track["title"],
+                                )
+                            )
+                        if current_track["title"] != self._previous_title:
+                            updates.append(
+                                asyncio.to_thread(
+                                    self._write_title, current_track["title"]
+                                )
+                            )
+                        if artists_text != self._previous_artists:
+                            updates.append(
+                                asyncio.to_thread(self._write_artists, artists_text)
                             )
 
-                        # Delete temporary file
-                        del response
-
-                        with open(self.song_title, "w", encoding="utf-8") as file:
-                            file.write(current_track["title"] + " " * 10)
-
-                        with open(self.artist, "w", encoding="utf-8") as file:
-                            file.write(" | ".join(current_track["artists"]))
-                            file.write(" " * 5)
+                        if updates:
+                            await asyncio.gather(*updates)
 
                         self._previous_track_id = current_track["id"]
+                        self._previous_artwork_url = current_track["artwork_url"]
+                        self._previous_title = current_track["title"]
+                        self._previous_artists = artists_text
 
-            except Exception as error:
-                print(f"{error}")
+            except Exception:
+                logger.exception("Stream player update failed")
 
             await asyncio.sleep(interval)
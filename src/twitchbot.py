@@ -16,41 +16,131 @@ __contact__ = {
 }
 
 import asyncio
+import atexit
+import hashlib
+import json
+import os
 import random
-from queue import Queue
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import requests
+import aiohttp
 import emoji
 import openai
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from twitchAPI import Twitch
 from twitchAPI.oauth import UserAuthenticator
 from twitchAPI.types import AuthScope, ChatEvent
 from twitchAPI.chat import Chat, EventData, ChatMessage, ChatSub, ChatCommand
 from .spotify import SpotifyClient, SpotifyReturnCode
 
-EIGHT_BALL_REPSONSES = [
-    emoji.emojize(":green_circle: It is certain."),
-    emoji.emojize(":green_circle: It is decidedly so."),
-    emoji.emojize(":green_circle: Without a doubt."),
-    emoji.emojize(":green_circle: Yes definitely."),
-    emoji.emojize(":green_circle: You may rely on it."),
-    emoji.emojize(":green_circle: As I see it, yes."),
-    emoji.emojize(":green_circle: Most likely."),
-    emoji.emojize(":green_circle: Outlook good."),
-    emoji.emojize(":green_circle: Yes."),
-    emoji.emojize(":green_circle: Signs point to yes."),
-    emoji.emojize(":yellow_circle: Reply hazy, try again."),
-    emoji.emojize(":yellow_circle: Ask again later."),
-    emoji.emojize(":yellow_circle: Better not tell you now."),
-    emoji.emojize(":yellow_circle: Cannot predict now."),
-    emoji.emojize(":yellow_circle: Concentrate and ask again."),
-    emoji.emojize(":red_circle: Don't count on it."),
-    emoji.emojize(":red_circle: My reply is no."),
-    emoji.emojize(":red_circle: My sources say no."),
-    emoji.emojize(":red_circle: Outlook not so good."),
-    emoji.emojize(":red_circle: Very doubtful."),
+# Each reply is fully pre-formatted at import, prefix included, so
+# eight_ball only picks an index and sends
+EIGHT_BALL_RESPONSES = tuple(
+    emoji.emojize(f":pool_8_ball: says.... {response}", language="alias")
+    for response in (
+        ":green_circle: It is certain.",
+        ":green_circle: It is decidedly so.",
+        ":green_circle: Without a doubt.",
+        ":green_circle: Yes definitely.",
+        ":green_circle: You may rely on it.",
+        ":green_circle: As I see it, yes.",
+        ":green_circle: Most likely.",
+        ":green_circle: Outlook good.",
+        ":green_circle: Yes.",
+        ":green_circle: Signs point to yes.",
+        ":yellow_circle: Reply hazy, try again.",
+        ":yellow_circle: Ask again later.",
+        ":yellow_circle: Better not tell you now.",
+        ":yellow_circle: Cannot predict now.",
+        ":yellow_circle: Concentrate and ask again.",
+        ":red_circle: Don't count on it.",
+        ":red_circle: My reply is no.",
+        ":red_circle: My sources say no.",
+        ":red_circle: Outlook not so good.",
+        ":red_circle: Very doubtful.",
+    )
+)
+_EIGHT_BALL_N = len(EIGHT_BALL_RESPONSES)
+
+# Static part of the GPT chat prompt; the user's message is appended per call
+CHAT_GPT_PROMPT = [
+    {
+        "role": "system",
+        "content": "You are a Twitch bot that is over the legal age of 21. "
+        "Trolling, explict content and language is allowed "
+        "as it is an over 18 channel",
+    },
+    {
+        "role": "assistant",
+        "content": "lmao look at this fucking noob! Why to get "
+        "absolutley #wrecked! Hold this L broski! hahaha",
+    },
+    {
+        "role": "user",
+        "content": "lmao! @therealcodemanbot that was funny as fuck! "
+        "Love the troll man! Let's keeping talking more shit!",
+    },
+    {"role": "assistant", "content": "okay! lfg!!! KEKW"},
+]
+
+# Static prompt prefixes for the other GPT handlers; built once here so each
+# call only appends (or reuses) the dynamic user turn
+GREETING_PROMPT = [
+    {
+        "role": "system",
+        "content": "You are a Twitch bot. "
+        "You provide a unique welcome reply to each user "
+        "and thank them for joining my Twitch stream.",
+    },
 ]
 
+SUB_PROMPT = [
+    {
+        "role": "system",
+        "content": "You are a Twitch bot. "
+        "You generate a thank you reply for subscribing"
+        "to my channel and supporting me",
+    },
+]
+
+INSULT_PROMPT = [
+    {
+        "role": "system",
+        "content": "You are a bully, a comedian, a very funny person, a brilliant jokester.",
+    },
+    {
+        "role": "assistant",
+        "content": "Shall we play a game of who has the best instult?",
+    },
+    {"role": "user", "content": "Yes! You go first!"},
+]
+
+GREETINGS = frozenset({"hello", "hi"})
+SONG_REQUEST_ALIASES = frozenset({"!sr", "!songrequest", "!spotifyrequest"})
+
+# bound and lifetime of the GPT response cache
+LLM_CACHE_SIZE = 512
+LLM_CACHE_TTL = 1800  # seconds
+
+# weather barely changes minute to minute; serve repeat !weather asks for the
+# same place from memory instead of burning API quota
+WEATHER_CACHE_TTL = 120  # seconds
+
+# minimum gap between costly commands from the same user; spam inside the
+# window is dropped before any I/O or API call happens
+USER_COOLDOWN = 5  # seconds
+
+# Twitch allows a regular bot ~20 messages per 30 seconds; the send loop
+# paces the outbound queue with a token bucket sized to that budget
+SEND_BUCKET_CAPACITY = 20
+SEND_REFILL_RATE = 20 / 30  # tokens per second
+
 STATS_FILE = "./data/total_stats.json"
 SESSION_DEATHS_FILE = "./data/session_deaths.txt"
 SESSION_WINS_FILE = "./data/session_wins.txt"
@@ -70,6 +160,53 @@ class CodemanTwitchBot:
     https://twitch.tv/therealcodeman
     """
 
+    # fixed attribute layout: no per-instance __dict__, and attribute loads
+    # in the per-message handlers become slot offset lookups
+    __slots__ = (
+        "twitch_tmi_token",
+        "twitch_client_id",
+        "twitch_client_secret",
+        "twitch",
+        "bot_name",
+        "_bot_mention",
+        "chat_prefix",
+        "channel",
+        "_channel_name",
+        "songs_for_stream",
+        "session_wins",
+        "total_stats",
+        "_dirty",
+        "_chat_ready",
+        "_main_loop",
+        "_out_queue",
+        "_llm_cache",
+        "_weather_cache",
+        "_user_last_cmd",
+        "_gpt_sem",
+        "_gpt_tasks",
+        "_rng",
+        "raffle_time",
+        "raffle_cooldown_time",
+        "openai_key",
+        "logging_path",
+        "logging",
+        "session_log",
+        "_log_fh",
+        "_http",
+        "_io_pool",
+        "spotify_client",
+        "weather_api_key",
+        "_weather_url",
+        "_weather_params",
+        "_lurk_reply",
+        "_socials_reply",
+        "_request_added_reply",
+        "_raffle_go_reply",
+        "_ready_banner",
+        "_win_reply_template",
+        "_request_failed_template",
+    )
+
     def __init__(
         self,
         bot_name: str,
@@ -91,27 +228,97 @@ class CodemanTwitchBot:
         self.twitch_client_secret: str = twitch_client_secret
         self.twitch: Twitch = None
         self.bot_name: str = bot_name
+        self._bot_mention: str = f"@{bot_name.lower()}"
         self.chat_prefix: str = prefix
         self.channel: dict = channel
+        self._channel_name: str = channel["name"]
         self.songs_for_stream: list = []
         self.session_wins: int = 0
-        self.recent_raffle: bool = False
-        self.raffle_time: datetime = None
+        self.total_stats: dict = {}
+        self._dirty: asyncio.Event = asyncio.Event()
+        # set by on_ready once the chat connection is joined; run() awaits it
+        # instead of polling chat.is_ready()
+        self._chat_ready: asyncio.Event = asyncio.Event()
+        # the loop run() executes on; twitchAPI drives its chat handlers from
+        # a separate thread/loop, so signals back to run() must cross threads
+        self._main_loop: asyncio.AbstractEventLoop = None
+        # outbound broadcast queue; one worker drains it so the periodic
+        # routines can't burst past Twitch's message rate limit
+        self._out_queue: asyncio.Queue = asyncio.Queue(maxsize=200)
+        self._llm_cache: OrderedDict = OrderedDict()
+        self._weather_cache: dict = {}  # normalized location -> (monotonic ts, reply)
+        self._user_last_cmd: dict = {}  # user -> monotonic ts of last command
+        # GPT handlers run as background tasks so the chat dispatcher never
+        # waits on an OpenAI round trip; the semaphore caps in-flight calls
+        self._gpt_sem: asyncio.Semaphore = asyncio.Semaphore(4)
+        self._gpt_tasks: set = set()
+        # dedicated PRNG instance; skips the module-singleton indirection and
+        # any lock contention if handlers ever run off-loop
+        self._rng: random.Random = random.Random()
+        self.raffle_time: float = 0.0  # monotonic timestamp of the last raffle
         self.raffle_cooldown_time: int = 15  # minutes
         self.openai_key: str = openai_key
+        if openai_key:
+            # set once; every handler shares the module-level client state
+            openai.api_key = openai_key
         self.logging_path: str = logging_path
         self.logging: bool = logging
         self.session_log: str = (
             f"session_{datetime.now().strftime('%d-%m-%y-%H-%M-%S')}.log"
         )
+        self._log_fh = None
+        self._http: aiohttp.ClientSession = None
+        # small bounded pool for blocking file I/O; reusing it avoids per-task
+        # thread setup and caps concurrency under chat bursts
+        self._io_pool: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="bot-io"
+        )
         self.spotify_client: SpotifyClient = spotify_instance
         self.weather_api_key: str = weather_api_key
+        # constant parts of the weather request; only the location varies
+        self._weather_url: str = "https://api.weatherapi.com/v1/forecast.json"
+        self._weather_params: dict = {"key": weather_api_key, "aqi": "no"}
+
+        # Pre-emojize the static replies once at startup; emoji.emojize scans
+        # the whole shortcode table, which is wasted work for constant output
+        self._lurk_reply: str = emoji.emojize(
+            f"@{channel['name']} rodger that! Thank you for supporting! :red_heart:",
+            language="alias",
+        )
+        self._socials_reply: str = emoji.emojize(
+            f":tv: YouTube: {__contact__['Youtube']}\n"
+            f":bird: Twitter: {__contact__['Twitter']}\n"
+            f"🤖 Discord: {__contact__['Discord']}",
+            language="alias",
+        )
+        self._request_added_reply: str = emoji.emojize(
+            "Request added! :notes:", language="alias"
+        )
+        self._raffle_go_reply: str = emoji.emojize(
+            "Okay! Let's do a raffle! :ticket:", language="alias"
+        )
+        self._ready_banner: str = emoji.emojize(
+            f"{bot_name} is up and running on Twitch! :robot:", language="alias"
+        )
+        # templates that interpolate a value: emojize once, .format() per call
+        self._win_reply_template: str = emoji.emojize(
+            ":trophy::trophy::trophy::trophy::trophy::trophy: THAT MAKES "
+            "{wins} WIN(S) ON THE DAY!!! LFG!!!",
+            language="alias",
+        )
+        self._request_failed_template: str = emoji.emojize(
+            ":exclamation: Failed to add request. "
+            "Reason: {reason} code: {code} :pensive:",
+            language="alias",
+        )
 
     # this is where we set up the bot
     async def run(self):
         """
         run the twitchbot
         """
+        self._main_loop = asyncio.get_running_loop()
+
         # set up twitch api instance and add user authentication with some scopes
         self.twitch = await Twitch(self.twitch_client_id, self.twitch_client_secret)
         auth = UserAuthenticator(self.twitch, USER_SCOPES, force_verify=True)
@@ -120,6 +327,12 @@ class CodemanTwitchBot:
             user_auth_token, USER_SCOPES, refresh_token
         )
 
+        # load the lifetime stats once; the in-memory copy is the source of
+        # truth from here on and gets flushed to disk by the persist loop
+        self.total_stats = await asyncio.get_running_loop().run_in_executor(
+            self._io_pool, self._read_stats
+        )
+
         # create chat instance
         chat = await Chat(self.twitch)
 
@@ -152,6 +365,7 @@ class CodemanTwitchBot:
         chat.register_command("socials", self.socials)
         chat.register_command("insultme", self.insult_me)
         chat.register_command("weather", self.weather)
+        chat.register_command("raffle", self.raffle)
         chat.register_command("sr", self.spotify_request)
         chat.register_command("song", self.spotify_now_playing)
         chat.register_command("queue", self.send_spotify_queue)
@@ -159,19 +373,19 @@ class CodemanTwitchBot:
         # we are done with our setup, lets start this bot up!
         chat.start()
 
-        while not chat.is_ready():
-            print(f"Waiting for chat to connect to channel {self.channel['name']}")
-            await asyncio.sleep(2)
+        print(f"Waiting for chat to connect to channel {self._channel_name}")
+        await self._chat_ready.wait()
 
         # lets run till we press enter in the console
         try:
             async with asyncio.TaskGroup() as task_group:
 
+                task_group.create_task(self._persist_loop())
                 task_group.create_task(
                     self.spotify_client.update_spotify_stream_player(10)
                 )
-                task_group.create_task(self.twitter_routine(chat, 2700))
-                task_group.create_task(self.discord_routine(chat, 3000))
+                task_group.create_task(self._send_loop(chat))
+                task_group.create_task(self.promo_routine())
 
         except KeyboardInterrupt as _:
             chat.stop()
@@ -183,39 +397,206 @@ class CodemanTwitchBot:
             )
             print("or through your broadcasting tool (OBS, Stream Labs, etc...)\n")
         finally:
+            if self._dirty.is_set():
+                self._write_stats()
+            if self._http is not None:
+                await self._http.close()
             chat.stop()
             await self.twitch.close()
 
+    def _log(self, text: str) -> None:
+        """
+        Append a line to the session log. The file is opened once with a big
+        buffer and reused, instead of paying an open/close per write.
+
+        Args:
+            text (str): line to append
+        """
+        if self._log_fh is None:
+            self._log_fh = open(
+                f"{self.logging_path}/{self.session_log}",
+                "a",
+                buffering=64 * 1024,
+                encoding="utf-8",
+            )
+            atexit.register(self._log_fh.close)
+        self._log_fh.write(f"{text}\n")
+
+    def _read_stats(self) -> dict:
+        """
+        Read the lifetime stats file from disk
+
+        Returns:
+            dict: the stats, or an empty dict if the file is missing/corrupt
+        """
+        try:
+            with open(STATS_FILE, "rb") as file:
+                raw = file.read()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write_stats(self) -> None:
+        """
+        Flush the in-memory stats to disk. Writes go to a temp file first and
+        are swapped in with os.replace() so a crash cannot leave a torn file.
+        """
+        temp_file = f"{STATS_FILE}.tmp"
+        with open(temp_file, "wb") as file:
+            if orjson is not None:
+                file.write(orjson.dumps(self.total_stats, option=orjson.OPT_INDENT_2))
+            else:
+                file.write(json.dumps(self.total_stats, indent=4).encode("utf-8"))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_file, STATS_FILE)
+
+        temp_file = f"{SESSION_WINS_FILE}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as file:
+            file.write(f"wins: {self.session_wins}")
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_file, SESSION_WINS_FILE)
+
+    def _mark_dirty(self) -> None:
+        """
+        Flag the stats as needing a flush. Command handlers run on the chat
+        thread's loop while _persist_loop waits on the main one, so the
+        Event is set via call_soon_threadsafe rather than directly.
+        """
+        self._main_loop.call_soon_threadsafe(self._dirty.set)
+
+    async def _persist_loop(self) -> None:
+        """
+        Background writer for the stats files. Commands only bump counters and
+        set the dirty flag; this loop coalesces bursts of updates and does the
+        actual disk write off the event loop.
+        """
+        while True:
+            await self._dirty.wait()
+            self._dirty.clear()
+            await asyncio.sleep(1)  # coalesce a burst of commands into one write
+            await asyncio.get_running_loop().run_in_executor(
+                self._io_pool, self._write_stats
+            )
+
     # this will be called when the event READY is triggered, which will be on bot start
     async def on_ready(self, ready_event: EventData):
         """Initialize the bot"""
 
-        channel = self.channel["name"]
+        channel = self._channel_name
         await ready_event.chat.join_room(channel)
         await ready_event.chat.send_message(
             channel, "I am ready to process messages! :)"
         )
 
-        print(
-            emoji.emojize(
-                f"{self.bot_name} is up and running on Twitch! :robot:",
-                language="alias",
-            )
-        )
+        print(self._ready_banner)
+        # this handler runs on the chat thread's loop; Event.set() is not
+        # thread-safe, so hand the wakeup to the loop run() is waiting on
+        self._main_loop.call_soon_threadsafe(self._chat_ready.set)
 
     async def on_message(self, msg: ChatMessage):
         """
         Determine if the message is a greeting or not. If it is, reply with a greeting,
         else ignore.
         """
-        if msg.text.lower() in ["hello", "hi"]:
-            await self.send_greeting(msg)
+        if self.logging:
+            self._log(f"{msg.user.name}: {msg.text}")
 
-        elif msg.text.lower() in ["!sr", "!songrequest", "!spotifyrequest"]:
+        # Twitch can deliver empty or whitespace-only messages (e.g. clears);
+        # bail before doing any string work on them
+        if not msg.text or msg.text.isspace():
+            return
+
+        text = msg.text.lower()
+
+        if text in GREETINGS:
+            if not self._on_cooldown(msg.user.name):
+                self._spawn_gpt(self.send_greeting(msg))
+
+        elif text in SONG_REQUEST_ALIASES:
             await self.spotify_request(msg)
 
-        elif msg.text.lower().split()[0] == f"@{self.bot_name}":
-            await self.chat_gpt(msg)
+        elif text.partition(" ")[0] == self._bot_mention:
+            if not self._on_cooldown(msg.user.name):
+                self._spawn_gpt(self.chat_gpt(msg))
+
+    def _on_cooldown(self, user_name: str) -> bool:
+        """
+        Per-user throttle for commands that cost I/O or API calls. The first
+        call in the window claims the slot; repeats are dropped at the edge
+        before any work happens.
+
+        Args:
+            user_name (str): chat user issuing the command
+
+        Returns:
+            bool: True if the user is still inside the cooldown window
+        """
+        now = time.monotonic()
+        if now - self._user_last_cmd.get(user_name, 0.0) < USER_COOLDOWN:
+            return True
+        self._user_last_cmd[user_name] = now
+        return False
+
+    def _spawn_gpt(self, handler) -> None:
+        """
+        Run a GPT-backed handler as a background task so the next chat
+        message isn't head-of-line-blocked behind the OpenAI round trip.
+        The task set keeps strong references until each task finishes.
+
+        Args:
+            handler: the handler coroutine to schedule
+        """
+        task = asyncio.create_task(self._bounded_gpt(handler))
+        self._gpt_tasks.add(task)
+        task.add_done_callback(self._gpt_tasks.discard)
+
+    async def _bounded_gpt(self, handler) -> None:
+        """
+        Gate a GPT handler behind the shared semaphore so a chat burst can't
+        open more than a few OpenAI requests at once.
+
+        Args:
+            handler: the handler coroutine to await
+        """
+        async with self._gpt_sem:
+            await handler
+
+    async def _gpt_completion(self, messages: list) -> str:
+        """
+        Run a chat completion with a small LRU+TTL cache in front. Repeat
+        prompts (spammed greetings, identical questions) answer from the
+        cache instead of paying the OpenAI round-trip and token cost.
+
+        Args:
+            messages (list): full messages payload for the completion
+
+        Returns:
+            str: the completion text
+        """
+        key = hashlib.blake2b(
+            json.dumps(messages, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+        cached = self._llm_cache.get(key)
+        if cached is not None:
+            response_text, cached_at = cached
+            if time.monotonic() - cached_at < LLM_CACHE_TTL:
+                self._llm_cache.move_to_end(key)
+                return response_text
+            del self._llm_cache[key]
+
+        response = await openai.ChatCompletion.acreate(
+            model="gpt-3.5-turbo", messages=messages
+        )
+        response_text = str(response["choices"][0]["message"]["content"])
+
+        self._llm_cache[key] = (response_text, time.monotonic())
+        if len(self._llm_cache) > LLM_CACHE_SIZE:
+            self._llm_cache.popitem(last=False)
+
+        return response_text
 
     async def send_greeting(self, msg: ChatMessage):
         """
@@ -226,30 +607,14 @@ class CodemanTwitchBot:
         """
         if not self.openai_key:
             await msg.reply(
-                f"Sorry, @{self.channel['name']} does not have GPT implemented."
+                f"Sorry, @{self._channel_name} does not have GPT implemented."
             )
         else:
-            # Generation Parameters from OpenAI Playground
-            openai.api_key = self.openai_key
-
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are a Twitch bot. "
-                    "You provide a unique welcome reply to each user "
-                    "and thank them for joining my Twitch stream.",
-                },
+            messages = GREETING_PROMPT + [
                 {"role": "user", "content": f"{msg.user.name} says {msg.text}"},
             ]
 
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=messages,
-            )
-
-            response = str(response["choices"][0]["message"]["content"])
-
-            await msg.reply(response)
+            await msg.reply(await self._gpt_completion(messages))
 
     # this will be called whenever someone subscribes to a channel
     async def on_sub(self, sub: ChatSub):
@@ -261,35 +626,21 @@ class CodemanTwitchBot:
         """
         if not self.openai_key:
             await sub.chat.send_message(
-                self.channel["name"],
-                f"Sorry, @{self.channel['name']} does not have the Open Ai API implemented.",
+                self._channel_name,
+                f"Sorry, @{self._channel_name} does not have the Open Ai API implemented.",
             )
         else:
-            # Generation Parameters from OpenAI Playground
-            openai.api_key = self.openai_key
-
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are a Twitch bot. "
-                    "You generate a thank you reply for subscribing"
-                    "to my channel and supporting me",
-                },
+            messages = SUB_PROMPT + [
                 {
                     "role": "user",
                     "content": f"{sub.chat.username} has subbed for {sub.sub_type}",
                 },
             ]
 
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=messages,
+            await sub.chat.send_message(
+                self._channel_name, await self._gpt_completion(messages)
             )
 
-            response = str(response["choices"][0]["message"]["content"])
-
-            await sub.chat.send_message(self.channel["name"], response)
-
     async def clip(self, cmd: ChatCommand):
         """
         Create a clip of the stream
@@ -313,10 +664,7 @@ class CodemanTwitchBot:
                 )
 
         except Exception as error_message:
-            with open(
-                f"{self.logging_path}/{self.session_log}", "w", encoding="utf-8"
-            ) as log:
-                log.write(f"Clip-Creation-Error:\n{error_message}")
+            self._log(f"Clip-Creation-Error:\n{error_message}")
             await cmd.reply(
                 "I am sorry, I could not create the clip. "
                 "Please have @therealcodeman check the debug logs."
@@ -330,18 +678,34 @@ class CodemanTwitchBot:
         Args:
             cmd (ChatCommand): _description_
         """
+        if self._on_cooldown(cmd.user.name):
+            return
+
         question = cmd.text
         if not question:
             await cmd.reply(
                 "ummm... you need to ask me a question before I can answer."
             )
         else:
-            await cmd.reply(
-                emoji.emojize(
-                    f":pool_8_ball: says.... {random.choice(EIGHT_BALL_REPSONSES)}",
-                    language="alias",
-                )
-            )
+            await cmd.reply(EIGHT_BALL_RESPONSES[self._rng.randrange(_EIGHT_BALL_N)])
+
+    def _bump_stat(self, key: str, delta: int = 1) -> int:
+        """
+        Apply a counter update to the in-memory stats and flag them for the
+        debounced flush. Every stat mutation funnels through here, so storage
+        changes only ever touch this function and _write_stats.
+
+        Args:
+            key (str): stats dict key
+            delta (int): amount to add
+
+        Returns:
+            int: the updated value
+        """
+        value = self.total_stats.get(key, 0) + delta
+        self.total_stats[key] = value
+        self._mark_dirty()
+        return value
 
     async def win(self, cmd: ChatCommand):
         """
@@ -351,17 +715,9 @@ class CodemanTwitchBot:
             cmd (ChatCommand): cmd Object
         """
         self.session_wins += 1
+        self._bump_stat("total_wz_wins")
 
-        with open(SESSION_WINS_FILE, "w", encoding="utf-8") as file:
-            file.write(f"wins: {self.session_wins}")
-
-        await cmd.send(
-            emoji.emojize(
-                ":trophy::trophy::trophy::trophy::trophy::trophy: THAT MAKES "
-                f"{self.session_wins} WIN(S) ON THE DAY!!! LFG!!!",
-                language="alias",
-            )
-        )
+        await cmd.send(self._win_reply_template.format(wins=self.session_wins))
 
     async def clear_wins(self, cmd: ChatCommand):
         """
@@ -371,9 +727,7 @@ class CodemanTwitchBot:
             cmd (ChatCommand): cmd Object
         """
         self.session_wins = 0
-
-        with open(SESSION_WINS_FILE, "w", encoding="utf-8") as file:
-            file.write(f"wins: {self.session_wins}")
+        self._mark_dirty()
 
         await cmd.send("Session wins have been reset to 0 :)")
 
@@ -407,79 +761,69 @@ class CodemanTwitchBot:
         """
         if not self.openai_key:
             await msg.reply(
-                f"Sorry, @{self.channel['name']} does not have GPT implemented."
+                f"Sorry, @{self._channel_name} does not have GPT implemented."
             )
         else:
-            # Generation Parameters from OpenAI Playground
-            openai.api_key = self.openai_key
-
-            formatted_message = msg.text.strip(f"@{self.bot_name}")
-
-            if msg.text is not None and msg.text != "":
-
-                messages = [
-                    {
-                        "role": "system",
-                        "content": "You are a Twitch bot that is over the legal age of 21. "
-                        "Trolling, explict content and language is allowed "
-                        "as it is an over 18 channel",
-                    },
-                    {
-                        "role": "assistant",
-                        "content": "lmao look at this fucking noob! Why to get "
-                        "absolutley #wrecked! Hold this L broski! hahaha",
-                    },
-                    {
-                        "role": "user",
-                        "content": "lmao! @therealcodemanbot that was funny as fuck! "
-                        "Love the troll man! Let's keeping talking more shit!",
-                    },
-                    {"role": "assistant", "content": "okay! lfg!!! KEKW"},
-                    {"role": "user", "content": formatted_message},
-                ]
+            # str.strip() takes a character set, not a prefix — it was eating
+            # letters off both ends of the message. Drop the leading mention
+            # (the first word, already matched in on_message) instead.
+            formatted_message = msg.text.partition(" ")[2].strip()
 
-                response = openai.ChatCompletion.create(
-                    model="gpt-3.5-turbo", messages=messages
-                )
+            if formatted_message:
+
+                messages = CHAT_GPT_PROMPT + [
+                    {"role": "user", "content": formatted_message}
+                ]
 
-                response = str(response["choices"][0]["message"]["content"])
+                response = await self._gpt_completion(messages)
 
                 # Determine if we need to break the message up
                 if len(response) > 450:
-                    await self.send_multiple_repsonses(response, msg)
+                    await self.send_multiple_responses(response, msg)
                 else:
                     await msg.reply(response)
 
             else:
                 await msg.reply("Yes?.")
 
-    async def send_multiple_respones(self, response: str, msg: ChatMessage):
+    async def send_multiple_responses(self, response: str, msg: ChatMessage):
         """
         Twitch only allows a message to be ~500 characters. GPT can
         return more than that sometimes. This function will break down
-        GPT's repsonse and send it in multiple replies.
+        GPT's response and send it in multiple replies.
 
         Args:
             response (str): String from GPT
             msg (ChatMessage): ChatMessage object from Twitch API
         """
-        words = response.split()
-
-        responses = Queue()
-
-        temp = ""
-        for word in words:
-            if len(temp) + len(word) < 450:
-                temp += f"{word} "
-            else:
-                responses.put(temp)
-                temp = ""
-
-        counter = 1
-        size = responses.qsize()
-        while not responses.empty():
-            await msg.reply(f"REPLY ({counter}/{size}): {responses.get()}")
-            counter += 1
+        # single greedy pass: accumulate words in a list and join per chunk
+        # (the old += string building re-copied the buffer per word and
+        # silently dropped the word that overflowed each chunk)
+        chunks = []
+        current = []
+        current_length = 0
+
+        for word in response.split():
+            word_length = len(word) + 1  # account for the joining space
+            if current and current_length + word_length >= 450:
+                chunks.append(" ".join(current))
+                current = []
+                current_length = 0
+            current.append(word)
+            current_length += word_length
+
+        if current:
+            chunks.append(" ".join(current))
+
+        # replies are numbered, so arrival order doesn't matter — issue them
+        # concurrently instead of paying one round trip per chunk
+        size = len(chunks)
+        await asyncio.gather(
+            *(
+                msg.reply(f"REPLY ({counter}/{size}): {chunk}")
+                for counter, chunk in enumerate(chunks, start=1)
+            )
+        )
 
     async def lurk(self, cmd: ChatCommand):
         """
@@ -488,12 +832,7 @@ class CodemanTwitchBot:
         Args:
             cmd (ChatCommand): cmd Object
         """
-        await cmd.reply(
-            emoji.emojize(
-                f"@{self.channel['name']} rodger that! Thank you for supporting! :red_heart:",
-                language="alias",
-            )
-        )
+        await cmd.reply(self._lurk_reply)
 
     async def insult_me(self, cmd: ChatCommand):
         """
@@ -502,34 +841,32 @@ class CodemanTwitchBot:
         Args:
             cmd (ChatCommand): cmd Object
         """
+        if self._on_cooldown(cmd.user.name):
+            return
+
         if not self.openai_key:
             await cmd.reply(
-                f"Sorry, @{self.channel['name']} does not have GPT implemented."
+                f"Sorry, @{self._channel_name} does not have GPT implemented."
             )
         else:
-            # Generation Parameters from OpenAI Playground
-            openai.api_key = self.openai_key
+            self._spawn_gpt(self._insult_reply(cmd))
 
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are a bully, a comedian, a very funny person, a brilliant jokester.",
-                },
-                {
-                    "role": "assistant",
-                    "content": "Shall we play a game of who has the best instult?",
-                },
-                {"role": "user", "content": "Yes! You go first!"},
-            ]
-
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=messages,
-            )
+    async def _insult_reply(self, cmd: ChatCommand):
+        """
+        Generate and send the insult; runs as a bounded background task so
+        the dispatcher is never held and the semaphore caps concurrency.
+        Stays on a direct acreate: the prompt is constant, so caching it
+        would pin one insult for the whole cache lifetime.
 
-            response = str(response["choices"][0]["message"]["content"])
+        Args:
+            cmd (ChatCommand): cmd Object
+        """
+        response = await openai.ChatCompletion.acreate(
+            model="gpt-3.5-turbo",
+            messages=INSULT_PROMPT,
+        )
 
-            await cmd.reply(response)
+        await cmd.reply(str(response["choices"][0]["message"]["content"]))
 
     async def spotify_request(self, cmd: ChatCommand):
         """
@@ -538,20 +875,25 @@ class CodemanTwitchBot:
         Args:
             cmd (ChatCommand): cmd Object
         """
-        request_url = cmd.text.split()[-1]
+        # a bare !sr would raise IndexError and kill the handler task
+        parts = cmd.text.split()
+        if not parts:
+            await cmd.reply("You need to give me a Spotify track link to request.")
+            return
+        request_url = parts[-1]
 
-        status = self.spotify_client.request_track(request_url)
+        # spotipy is synchronous; run it off the event loop so chat handling
+        # is not stalled by the Spotify round-trip
+        status = await asyncio.to_thread(self.spotify_client.request_track, request_url)
 
         if status != SpotifyReturnCode.SUCCESS:
             await cmd.reply(
-                emoji.emojize(
-                    ":exclamation: Failed to add request. "
-                    f"Reason: {status.name} code: {status.value} :pensive:",
-                    language="alias",
+                self._request_failed_template.format(
+                    reason=status.name, code=status.value
                 )
             )
         else:
-            await cmd.reply(emoji.emojize("Request added! :notes:", language="alias"))
+            await cmd.reply(self._request_added_reply)
 
     async def spotify_now_playing(self, cmd: ChatCommand):
         """
@@ -560,7 +902,7 @@ class CodemanTwitchBot:
         Args:
             cmd (ChatCommand): cmd Object
         """
-        response = self.spotify_client.get_now_playing()
+        response = await asyncio.to_thread(self.spotify_client.get_now_playing)
 
         if response["return_code"] == SpotifyReturnCode.SUCCESS:
 
@@ -577,7 +919,7 @@ class CodemanTwitchBot:
         Args:
             cmd (ChatCommand): cmd Object
         """
-        response = self.spotify_client.get_queued_songs()
+        response = await asyncio.to_thread(self.spotify_client.get_queued_songs)
 
         if response["return_code"] == SpotifyReturnCode.SUCCESS:
 
@@ -594,14 +936,7 @@ class CodemanTwitchBot:
         Args:
             cmd (ChatCommand): cmd Object
         """
-        formatted_socials = emoji.emojize(
-            f":tv: YouTube: {__contact__['Youtube']}\n"
-            f":bird: Twitter: {__contact__['Twitter']}\n"
-            f"🤖 Discord: {__contact__['Discord']}",
-            language="alias",
-        )
-
-        await cmd.send(formatted_socials)
+        await cmd.send(self._socials_reply)
 
     async def weather(self, cmd: ChatCommand):
         """
@@ -610,12 +945,31 @@ class CodemanTwitchBot:
         Args:
             cmd (ChatCommand): _description_
         """
+        if self._on_cooldown(cmd.user.name):
+            return
+
         location = cmd.text
 
-        url = f"https://api.weatherapi.com/v1/forecast.json?key=57dd1eeea5374875a0131010232002&q={location}&aqi=no"
+        cache_key = location.strip().lower()
+        cached = self._weather_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < WEATHER_CACHE_TTL:
+            await cmd.reply(cached[1])
+            return
+
+        if self._http is None:
+            # lazily created so the session binds to the running loop, then
+            # reused for every weather call (pooled connection, no handshake);
+            # cache DNS and keep the connection warm between lookups
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=20, ttl_dns_cache=300, keepalive_timeout=60
+                )
+            )
 
-        response = requests.get(url)
-        data = response.json()
+        async with self._http.get(
+            self._weather_url, params={**self._weather_params, "q": location}
+        ) as response:
+            data = await response.json()
 
         name = data["location"]["name"]
         region = data["location"]["region"]
@@ -633,33 +987,68 @@ class CodemanTwitchBot:
             f"Data was last updated at {last_updated}."
         )
 
+        self._weather_cache[cache_key] = (time.monotonic(), reply)
         await cmd.reply(reply)
 
-    async def twitter_routine(self, chat: Chat, interval: int):
+    async def _send_loop(self, chat: Chat):
         """
-        routine to post the twitter link
+        Drain the outbound broadcast queue through a token bucket. Funnelling
+        the periodic sends through one paced worker means unrelated routines
+        can't burst the channel past Twitch's message rate limit.
         """
+        tokens = float(SEND_BUCKET_CAPACITY)
+        last_refill = time.monotonic()
+
         while True:
-            message = (
-                "Follow therealcodeman on 🐦 Twitter! 💩 posts, MEMES, Live notifications and more\n"
-                f"{__contact__['Twitter']}"
-            )
-            await chat.send_message(self.channel["name"], message)
-            await asyncio.sleep(interval)
+            message = await self._out_queue.get()
 
-    async def discord_routine(self, chat: Chat, interval: int):
+            now = time.monotonic()
+            tokens = min(
+                float(SEND_BUCKET_CAPACITY),
+                tokens + (now - last_refill) * SEND_REFILL_RATE,
+            )
+            last_refill = now
+            if tokens < 1.0:
+                # out of budget; wait for the bucket to earn the next token
+                await asyncio.sleep((1.0 - tokens) / SEND_REFILL_RATE)
+                tokens = 1.0
+                last_refill = time.monotonic()
+            tokens -= 1.0
+
+            await chat.send_message(self._channel_name, message)
+            self._out_queue.task_done()
+
+    async def promo_routine(self):
         """
-        routine to post the discord link
+        Single scheduler for the periodic promo messages: one task tracks
+        when each promo is next due and sleeps until the nearest deadline,
+        instead of one task (and one wakeup cadence) per message. Sends go
+        through the outbound queue rather than straight to chat.
         """
-        while True:
-            message = (
-                "Board the spaceship and join fellow Astronauts 🧑‍🚀👩‍🚀👨‍🚀 on this adventure!\n"
+        promos = [
+            # [message, interval in seconds, monotonic deadline]
+            [
+                "Follow therealcodeman on 🐦 Twitter! 💩 posts, MEMES, Live notifications and more\n"
+                f"{__contact__['Twitter']}",
+                2700,
+                0.0,
+            ],
+            [
+                "Board the spaceship and join fellow Astronauts 🧑\u200d🚀👩\u200d🚀👨\u200d🚀 on this adventure!\n"
                 "Join the Discord for livestream notifications, contests, memes and more!\n"
-                f"{__contact__['Discord']}"
-            )
+                f"{__contact__['Discord']}",
+                3000,
+                0.0,
+            ],
+        ]
 
-            await chat.send_message(self.channel["name"], message)
-            await asyncio.sleep(interval)
+        while True:
+            due = min(promos, key=lambda promo: promo[2])
+            delay = due[2] - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self._out_queue.put(due[0])
+            due[2] = time.monotonic() + due[1]
 
     # @routines.routine(minutes=30)
     # async def merch_routine(self):
@@ -671,35 +1060,25 @@ class CodemanTwitchBot:
     #     )
     #     await self.get_channel("therealcodeman").send(message)
 
-    # async def raffle(self, cmd: ChatCommand):
-    #     """
-    #     Return a hello to the user
+    async def raffle(self, cmd: ChatCommand):
+        """
+        Kick off a chat raffle, rate limited by the cooldown timer.
+        Uses time.monotonic() so the cooldown is immune to wall-clock jumps
+        and avoids the datetime allocations per invocation.
 
-    #     Args:
-    #         cmd (ChatCommand): cmd Object
-    #     """
-    #     current_time = datetime.now()
-
-    #     if self.recent_raffle:
-
-    #         elapsed_time = (current_time - self.raffle_time).total_seconds() // 60
-    #         if elapsed_time >= self.raffle_cooldown_time:
-    #             await cmd.send(
-    #                 emoji.emojize("Okay! Let's do a raffle! :ticket:", language="alias")
-    #             )
-    #             await cmd.send("!raffle")
-    #             self.raffle_time = datetime.now()
-    #             self.recent_raffle = True
-    #         else:
-    #             await cmd.send(
-    #                 f"I am sorry, {cmd.author.mention}, "
-    #                 "raffle is currently in cool down for another "
-    #                 f"{self.raffle_cooldown_time - elapsed_time} minute(s).",
-    #             )
-    #     else:
-    #         await cmd.send(
-    #             emoji.emojize("Okay! Let's do a raffle! :ticket:", language="alias")
-    #         )
-    #         await cmd.send("!raffle")
-    #         self.raffle_time = datetime.now()
-    #         self.recent_raffle = True
+        Args:
+            cmd (ChatCommand): cmd Object
+        """
+        now = time.monotonic()
+        elapsed_minutes = (now - self.raffle_time) / 60.0
+
+        if self.raffle_time and elapsed_minutes < self.raffle_cooldown_time:
+            await cmd.send(
+                f"I am sorry, @{cmd.user.name}, "
+                "raffle is currently in cool down for another "
+                f"{int(self.raffle_cooldown_time - elapsed_minutes)} minute(s)."
+            )
+        else:
+            # overlap the two IRC writes instead of waiting on each in turn
+            await asyncio.gather(cmd.send(self._raffle_go_reply), cmd.send("!raffle"))
+            self.raffle_time = now